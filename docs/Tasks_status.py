@@ -1,6 +1,14 @@
 from typing import List, Tuple
 # Tasks status page
 
+# Markdown section headers shared by every generated status page
+
+TITLE_HEADER = "# Tasks Status Page\n\n"
+AGENTS_HEADER = "## Agents\n\n| Agent Role | Status | Notes |\n| ---------- | ------ | ----- |\n"
+SCRIPTS_HEADER = "\n## Scripts\n\n| Script | Agent | Status | Notes |\n| ------ | ----- | ------ | ----- |\n"
+DOCUMENTS_HEADER = "\n## Documentation\n\n| Document | Status | Notes |\n| -------- | ------ | ----- |\n"
+NEXT_STEPS_HEADER = "\n## Next Steps\n\n"
+
 # Define tasks and their corresponding status and notes
 
 def generate_markdown(tasks: List[Tuple[str, str, str]],
@@ -19,24 +27,23 @@ def generate_markdown(tasks: List[Tuple[str, str, str]],
     :param next_steps: A list of strings representing the possible next steps for the project.
     :return: None.
     """
-    with open("tasks_status.md", "w") as f:
-        f.write("# Tasks Status Page\n\n")
+    parts = [TITLE_HEADER]
 
-        f.write("## Agents\n\n| Agent Role | Status | Notes |\n| ---------- | ------ | ----- |\n")
-        for agent, status, notes in agents:
-            f.write(f"| {agent} | {status} | {notes} |\n")
+    parts.append(AGENTS_HEADER)
+    parts.extend(f"| {agent} | {status} | {notes} |\n" for agent, status, notes in agents)
 
-        f.write("\n## Scripts\n\n| Script | Agent | Status | Notes |\n| ------ | ----- | ------ | ----- |\n")
-        for script, agent, status in scripts:
-            f.write(f"| {script} | {agent} | {status} |\n")
+    parts.append(SCRIPTS_HEADER)
+    parts.extend(f"| {script} | {agent} | {status} |\n" for script, agent, status in scripts)
 
-        f.write("\n## Documentation\n\n| Document | Status | Notes |\n| -------- | ------ | ----- |\n")
-        for document, status, notes in documents:
-            f.write(f"| {document} | {status} | {notes} |\n")
+    parts.append(DOCUMENTS_HEADER)
+    parts.extend(f"| {document} | {status} | {notes} |\n" for document, status, notes in documents)
 
-        f.write("\n## Next Steps\n\n")
-        for step in next_steps:
-            f.write(f"{step}\n")
+    parts.append(NEXT_STEPS_HEADER)
+    parts.extend(f"{step}\n" for step in next_steps)
+
+    # Assemble once and issue a single write instead of one write per row.
+    with open("tasks_status.md", "w") as f:
+        f.write("".join(parts))
 
 
 # Define tasks and their corresponding status and notes